@@ -1,21 +1,30 @@
+from itertools import islice
+from operator import itemgetter
+
+
 def merge_intervals(intervals):
     """
     intervals: list of (start, end)
     return: merged list of intervals
+
+    Single linear pass after the sort: the interval being grown is kept in
+    two locals, and a tuple is only built once per merged interval.
     """
 
     if not intervals:
         return []
     # sort by start
-    intervals.sort(key=lambda x: x[0])
-    merged = [intervals[0]]
-
-    for cur_start, cur_end in intervals[1:]:
-        last_start, last_end = merged[-1]
+    intervals.sort(key=itemgetter(0))
+    merged = []
+    cur_start, cur_end = intervals[0]
 
-        if cur_start <= last_end:
+    for start, end in islice(intervals, 1, None):
+        if start <= cur_end:
             # overlap → merge
-            merged[-1] = (last_start, max(last_end, cur_end))
+            if end > cur_end:
+                cur_end = end
         else:
             merged.append((cur_start, cur_end))
+            cur_start, cur_end = start, end
+    merged.append((cur_start, cur_end))
     return merged
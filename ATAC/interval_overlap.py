@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import List, Tuple, Dict
 
 Interval = Tuple[int, int]
@@ -42,26 +43,81 @@ def find_overlaps_1d(
     a = list(intervals_a)
     b = list(intervals_b)
 
-    a.sort(key=lambda x: x[0])
-    b.sort(key=lambda x: x[0])
+    a.sort(key=itemgetter(0))
+    b.sort(key=itemgetter(0))
 
+    result: List[Tuple[int, int]] = []
+    na = len(a)
+    nb = len(b)
+    if na == 0 or nb == 0:
+        return result
+
+    # Same sweep as _sweep_overlaps(), but the indices are the positions
+    # i / j themselves, so no (start, end, idx) copies are built.
+    append = result.append
     i = 0
     j = 0
-    result = []
-    while i < len(a) and j < len(b):
-        a_int = a[i]
-        b_int = b[j]
+    a_start, a_end = a[0]
+    b_start, b_end = b[0]
 
-        if intervals_overlap(a_int, b_int):
-            result.append((i, j))
+    while True:
+        if a_start < b_end and b_start < a_end:
+            append((i, j))
 
         # Move the pointer with the smaller end coordinate
-        if a_int[1] <= b_int[1]:
+        if a_end <= b_end:
             i += 1
+            if i == na:
+                return result
+            a_start, a_end = a[i]
         else:
             j += 1
+            if j == nb:
+                return result
+            b_start, b_end = b[j]
+
+
+def _sweep_overlaps(
+    list_a: List[Tuple[int, int, int]],
+    list_b: List[Tuple[int, int, int]],
+    out: List[Tuple[int, int]],
+) -> None:
+    """
+    Two-pointer sweep kernel used by find_overlaps_genomic().
+
+    list_a / list_b hold (start, end, idx) sorted by start; every overlapping
+    pair (idx_a, idx_b) is appended to `out`.
+
+    The loop keeps both current intervals unpacked in locals and only re-reads
+    the side whose pointer moved, so each step does one tuple unpack and no
+    len() calls.
+    """
+    na = len(list_a)
+    nb = len(list_b)
+    if na == 0 or nb == 0:
+        return
+
+    append = out.append
+    i = 0
+    j = 0
+    a_start, a_end, a_idx = list_a[0]
+    b_start, b_end, b_idx = list_b[0]
 
-    return result
+    while True:
+        if a_start < b_end and b_start < a_end:
+            append((a_idx, b_idx))
+
+        # Move the pointer with the smaller end coordinate
+        if a_end <= b_end:
+            i += 1
+            if i == na:
+                return
+            a_start, a_end, a_idx = list_a[i]
+        else:
+            j += 1
+            if j == nb:
+                return
+            b_start, b_end, b_idx = list_b[j]
 
 #  Genomic interval operations
 
@@ -89,7 +145,7 @@ def group_by_chrom(intervals: List[GenomicInterval]) -> Dict[str, List[Interval]
 
     # Sort each chromosome's intervals by start
     for chrom in grouped:
-        grouped[chrom].sort(key=lambda x: x[0])
+        grouped[chrom].sort(key=itemgetter(0))
 
     return grouped
 
@@ -132,33 +188,15 @@ def find_overlaps_genomic(
 
     # Sort by start within each chromosome
     for chrom in grouped_a:
-        grouped_a[chrom].sort(key=lambda x: x[0])
+        grouped_a[chrom].sort(key=itemgetter(0))
     for chrom in grouped_b:
-        grouped_b[chrom].sort(key=lambda x: x[0])
+        grouped_b[chrom].sort(key=itemgetter(0))
 
     overlaps: List[Tuple[int, int]] = []
 
     # For chromosomes that appear in both sets
     for chrom in grouped_a.keys() & grouped_b.keys():
-        list_a = grouped_a[chrom]
-        list_b = grouped_b[chrom]
-
-        i = 0
-        j = 0
-
-        while i < len(list_a) and j < len(list_b):
-            a_start, a_end, a_idx = list_a[i]
-            b_start, b_end, b_idx = list_b[j]
-
-            # Check overlap
-            if (a_start < b_end) and (b_start < a_end):
-                overlaps.append((a_idx, b_idx))
-
-            # Move the pointer with smaller end
-            if a_end <= b_end:
-                i += 1
-            else:
-                j += 1
+        _sweep_overlaps(grouped_a[chrom], grouped_b[chrom], overlaps)
 
     return overlaps
 
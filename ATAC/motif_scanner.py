@@ -5,7 +5,7 @@ What this module provides
 -------------------------
 1) Reverse complement for DNA sequences.
 2) Build a PWM in log-likelihood ratio (LLR) form.
-3) Slide a window across a sequence and score each k-mer.
+3) Encode sequences / PWMs as lookup arrays and score every window at once.
 4) Scan both strands (+ and -) and report top motif hits.
 
 Notes
@@ -15,14 +15,43 @@ Notes
   Here we focus on the core algorithm: sliding window motif scoring.
 """
 
+from itertools import accumulate, compress, repeat
+from operator import add, eq, itemgetter
 from typing import Dict, List, Tuple, Optional
+import heapq
 import math
 
 # A PWM can be represented as: pwm[pos][base] = probability
 PWM = List[Dict[str, float]]
+# Array form used by the scanner: pwm_arr[pos][code], code = index in BASES
+PWMArray = List[List[float]]
 
 BASES = ("A", "C", "G", "T")
 _COMP = {"A": "T", "T": "A", "C": "G", "G": "C"}
+# Complement of an upper-case A/C/G/T k-mer, for minus-strand hits.
+_COMP_KMER = str.maketrans(_COMP)
+
+# ASCII -> base code lookup (A=0, C=1, G=2, T=3, anything else = _N_CODE)
+_N_CODE = 4
+_CODE_TABLE = bytearray([_N_CODE]) * 256
+for _code, _base in enumerate(BASES):
+    _CODE_TABLE[ord(_base)] = _code
+    _CODE_TABLE[ord(_base.lower())] = _code
+_CODE_TABLE = bytes(_CODE_TABLE)
+# ASCII -> complement lookup (case-insensitive, unknown bases -> N)
+_RC_TABLE = bytearray(b"N") * 256
+for _base, _comp in _COMP.items():
+    _RC_TABLE[ord(_base)] = ord(_comp)
+    _RC_TABLE[ord(_base.lower())] = ord(_comp)
+_RC_TABLE = bytes(_RC_TABLE)
+# Map invalid codes to 0 so they can be looked up; such windows are masked.
+_N_TO_ZERO = bytes.maketrans(bytes([_N_CODE]), b"\x00")
+# Base code -> 1 if invalid else 0, for the invalid-base prefix count.
+_N_FLAG = bytes(int(c == _N_CODE) for c in range(256))
+# Base code c -> 4 * c, to build dinucleotide codes 4 * c[i] + c[i+1].
+_TIMES_4 = bytes((4 * c) & 0xFF for c in range(256))
+# Dinucleotide code d -> 16 * d, to pack 4 bases (2 bits each) into one byte.
+_TIMES_16 = bytes((16 * c) & 0xFF for c in range(256))
 
 
 # --------------------------
@@ -34,8 +63,17 @@ def reverse_complement(seq: str) -> str:
     Reverse complement of a DNA sequence.
     Unknown bases (e.g., N) are kept as 'N'.
     """
-    seq = seq.upper()
-    return "".join(_COMP.get(b, "N") for b in reversed(seq))
+    return reverse_complement_bytes(
+        seq.encode("ascii", errors="replace")).decode("ascii")
+
+
+def reverse_complement_bytes(seq: bytes) -> bytes:
+    """
+    Reverse complement of an ASCII-encoded DNA sequence.
+    One C-level bytes.translate() pass plus a reversing slice; output is
+    upper case and unknown bases become b'N'.
+    """
+    return seq.translate(_RC_TABLE)[::-1]
 
 
 def is_valid_dna_kmer(kmer: str) -> bool:
@@ -48,6 +86,15 @@ def is_valid_dna_kmer(kmer: str) -> bool:
     return True
 
 
+def encode_dna(seq: str) -> bytes:
+    """
+    Encode a DNA sequence as one byte code per base:
+        A=0, C=1, G=2, T=3, anything else (N, IUPAC, ...) = 4.
+    Case-insensitive; output length equals len(seq).
+    """
+    return seq.encode("ascii", errors="replace").translate(_CODE_TABLE)
+
+
 # --------------------------
 # PWM / scoring
 # --------------------------
@@ -91,6 +138,22 @@ def pwm_to_llr(
     return llr_pwm
 
 
+def pwm_to_array(llr_pwm: PWM) -> PWMArray:
+    """
+    Convert a dict-based PWM into rows indexed by base code:
+        pwm_arr[pos][code] with code order A, C, G, T.
+    """
+    return [[row[b] for b in BASES] for row in llr_pwm]
+
+
+def reverse_complement_pwm(pwm_arr: PWMArray) -> PWMArray:
+    """
+    PWM for the opposite strand: rc[i][code] = pwm_arr[k-1-i][complement(code)].
+    With code order A, C, G, T the complement of code c is 3 - c.
+    """
+    return [row[::-1] for row in reversed(pwm_arr)]
+
+
 def score_kmer_llr(kmer: str, llr_pwm: PWM) -> float:
     """
     Score a k-mer using LLR PWM (sum over positions).
@@ -102,6 +165,97 @@ def score_kmer_llr(kmer: str, llr_pwm: PWM) -> float:
     return score
 
 
+def _lead_table(pwm_arr: PWMArray, m: int, reverse: bool) -> List[float]:
+    """
+    Fold the first m PWM positions that score_windows() adds (the last m when
+    reverse) into one table over their base codes packed 2 bits apiece, lower
+    offset first: table[4 * c0 + c1] for m = 2,
+    table[64 * c0 + 16 * c1 + 4 * c2 + c3] for m = 4. Each entry adds its terms from
+    0.0 in that same order, so the table changes no float result.
+    """
+    first = len(pwm_arr) - m if reverse else 0
+    order = range(m - 1, -1, -1) if reverse else range(m)
+    table = []
+    for packed in range(4 ** m):
+        base_codes = [(packed >> 2 * (m - 1 - i)) & 3 for i in range(m)]
+        acc = 0.0
+        for i in order:
+            acc += pwm_arr[first + i][base_codes[i]]
+        table.append(acc)
+    return table
+
+
+def score_windows(
+    codes: bytes,
+    pwm_arr: PWMArray,
+    reverse: bool = False,
+) -> Tuple[List[int], List[float]]:
+    """
+    Score every length-k window of an encoded sequence.
+
+    Instead of scoring one k-mer at a time, this works one PWM position at a
+    time: position j contributes pwm_arr[j][codes[i + j]] to window i, and the
+    whole column is gathered / added with C-level map() calls. The first (up
+    to) four positions added are looked up together in one 256-entry table
+    indexed by their bases packed 2 bits apiece into a byte (_lead_table),
+    saving three passes. Only that leading block is folded: folding later
+    blocks would regroup the float sum and change scores in the last ulp.
+
+    Parameters
+    ----------
+    codes : bytes
+        Encoded sequence from encode_dna().
+    pwm_arr : PWMArray
+        PWM rows from pwm_to_array(), length k.
+    reverse : bool
+        Add the positions from last to first. With reverse_complement_pwm()
+        this scores the opposite strand and adds each window's terms in the
+        same order as score_kmer_llr() on the reverse-complemented k-mer.
+
+    Returns
+    -------
+    positions, scores : list of int, list of float
+        Start positions of windows without invalid bases and their scores.
+    """
+    k = len(pwm_arr)
+    n = len(codes) - k + 1
+    if n <= 0:
+        return [], []
+
+    lookup = codes.translate(_N_TO_ZERO)
+    m = min(k, 4)
+    packed = lookup
+    if m >= 2:
+        # pair[i] = 4 * code[i] + code[i + 1]
+        packed = bytes(map(add, lookup.translate(_TIMES_4), lookup[1:]))
+    if m == 3:
+        # 16 * code[i] + 4 * code[i + 1] + code[i + 2]
+        packed = bytes(map(add, packed.translate(_TIMES_4), lookup[2:]))
+    elif m == 4:
+        # quad[i] = 64 * code[i] + 16 * code[i + 1] + 4 * code[i + 2] + code[i + 3]
+        packed = bytes(map(add, packed.translate(_TIMES_16), packed[2:]))
+    off = k - m if reverse else 0
+    head = _lead_table(pwm_arr, m, reverse)
+
+    # One lazy lookup stream per position, chained through map(add) and
+    # consumed in a single pass: no per-position score list is built. Each
+    # window still adds its terms one at a time, in the same order as
+    # score_kmer_llr() (sum() is not used: it compensates since 3.12).
+    acc = map(head.__getitem__, packed[off:off + n]) if k else repeat(0.0, n)
+    for j in (range(k - m - 1, -1, -1) if reverse else range(m, k)):
+        acc = map(add, acc, map(pwm_arr[j].__getitem__, lookup[j:j + n]))
+    scores = list(acc)
+
+    if _N_CODE not in codes:
+        return list(range(n)), scores
+
+    # One O(L) pass for validity: with bad_cum[i] = #invalid bases in codes[:i],
+    # window i is valid iff bad_cum[i + k] == bad_cum[i].
+    bad_cum = list(accumulate(codes.translate(_N_FLAG), initial=0))
+    valid = list(map(eq, bad_cum[k:], bad_cum[:n]))
+    return list(compress(range(n), valid)), list(compress(scores, valid))
+
+
 # --------------------------
 # Sliding window scanning
 # --------------------------
@@ -123,7 +277,7 @@ def scan_sequence_pwm(
         LLR PWM of length k
     strand : '+' or '-'
         '+' scans seq as-is.
-        '-' scans reverse complement of seq, and reports coordinates on original seq.
+        '-' scores the reverse complement of seq, and reports coordinates on original seq.
     return_all_scores : bool
         If True, return a list of (pos, score, kmer) for every valid window.
         If False, still returns all valid windows; filtering is done by caller.
@@ -135,33 +289,41 @@ def scan_sequence_pwm(
         For strand '-', pos still refers to original coordinate.
     """
     seq = seq.upper()
-    k = len(llr_pwm)
 
     if strand not in ("+", "-"):
         raise ValueError("strand must be '+' or '-'")
 
-    # Prepare scan sequence
-    scan_seq = seq if strand == "+" else reverse_complement(seq)
-    hits: List[Tuple[int, float, str]] = []
+    return _strand_hits(seq, encode_dna(seq), pwm_to_array(llr_pwm), strand)
 
-    for i in range(0, len(scan_seq) - k + 1):
-        kmer = scan_seq[i:i+k]
-        if not is_valid_dna_kmer(kmer):
-            continue
 
-        score = score_kmer_llr(kmer, llr_pwm)
-
-        # Convert i back to original coordinates if scanning reverse complement:
-        # If scan_seq is RC(seq), then a window starting at i in RC corresponds to:
-        # original start = len(seq) - (i + k)
-        if strand == "-":
-            orig_i = len(seq) - (i + k)
-        else:
-            orig_i = i
-
-        hits.append((orig_i, score, kmer))
+def _strand_hits(
+    seq: str,
+    codes: bytes,
+    pwm_arr: PWMArray,
+    strand: str,
+) -> List[Tuple[int, float, str]]:
+    """
+    Build (pos, score, kmer) hits for one strand from the forward encoding.
 
-    return hits
+    The '-' strand is scored on the forward codes with the reverse-complemented
+    PWM: the forward window at p is the RC window starting at
+    len(seq) - (p + k), so no reverse-complemented copy of seq is needed.
+    Its positions are added last to first, which is the order a scan of the
+    RC sequence adds them in, and only the reported k-mers are complemented.
+    """
+    k = len(pwm_arr)
+    if strand == "+":
+        positions, scores = score_windows(codes, pwm_arr)
+        return [(i, score, seq[i:i+k]) for i, score in zip(positions, scores)]
+
+    positions, scores = score_windows(
+        codes, reverse_complement_pwm(pwm_arr), reverse=True)
+    # walk backwards so hits keep the order of a scan along the RC sequence;
+    # windows with other bases are masked, so each k-mer is plain A/C/G/T
+    return [
+        (p, score, seq[p:p+k].translate(_COMP_KMER)[::-1])
+        for p, score in zip(reversed(positions), reversed(scores))
+    ]
 
 
 def scan_both_strands(
@@ -171,11 +333,15 @@ def scan_both_strands(
     """
     Scan both strands and return combined hits:
         (pos, score, kmer, strand)
+    The sequence is encoded once and shared by both strands.
     """
+    seq = seq.upper()
+    codes = encode_dna(seq)
+    pwm_arr = pwm_to_array(llr_pwm)
     hits_plus = [(pos, score, kmer, "+") for pos, score,
-                 kmer in scan_sequence_pwm(seq, llr_pwm, strand="+")]
+                 kmer in _strand_hits(seq, codes, pwm_arr, "+")]
     hits_minus = [(pos, score, kmer, "-") for pos, score,
-                  kmer in scan_sequence_pwm(seq, llr_pwm, strand="-")]
+                  kmer in _strand_hits(seq, codes, pwm_arr, "-")]
     return hits_plus + hits_minus
 
 
@@ -186,11 +352,14 @@ def top_hits(
 ) -> List[Tuple[int, float, str, str]]:
     """
     Take top motif hits by score, optionally filter by min_score.
+
+    Uses a bounded heap (heapq.nlargest, O(N log top_n)) instead of sorting
+    all N hits; ties keep their input order, as with a stable full sort.
+    The input list is not modified.
     """
     if min_score is not None:
         hits = [h for h in hits if h[1] >= min_score]
-    hits.sort(key=lambda x: x[1], reverse=True)
-    return hits[:top_n]
+    return heapq.nlargest(top_n, hits, key=itemgetter(1))
 
 
 # --------------------------
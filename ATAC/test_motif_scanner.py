@@ -0,0 +1,64 @@
+"""
+score_windows() must give exactly the scores of score_kmer_llr(), term by
+term in the same order, on both strands: tied hits in top_hits() are only
+ordered reproducibly if no window's score moves by an ulp.
+"""
+
+import random
+
+from motif_scanner import (
+    BASES,
+    encode_dna,
+    pwm_to_array,
+    pwm_to_llr,
+    reverse_complement,
+    reverse_complement_pwm,
+    score_kmer_llr,
+    score_windows,
+)
+
+
+def _random_llr(rng: random.Random, k: int):
+    pwm = []
+    for _ in range(k):
+        weights = [rng.random() for _ in BASES]
+        total = sum(weights)
+        pwm.append({b: w / total for b, w in zip(BASES, weights)})
+    return pwm_to_llr(pwm)
+
+
+def _random_cases(seed: int, n_cases: int = 300):
+    rng = random.Random(seed)
+    for _ in range(n_cases):
+        k = rng.randint(1, 16)
+        seq = "".join(rng.choice("ACGTACGTN") for _ in range(rng.randint(0, 80)))
+        yield seq, k, _random_llr(rng, k)
+
+
+def test_score_windows_equals_score_kmer_llr():
+    for seq, k, llr in _random_cases(0):
+        positions, scores = score_windows(encode_dna(seq), pwm_to_array(llr))
+        expected = [
+            (i, score_kmer_llr(seq[i:i+k], llr))
+            for i in range(len(seq) - k + 1)
+            if "N" not in seq[i:i+k]
+        ]
+        assert list(zip(positions, scores)) == expected
+
+
+def test_reverse_strand_equals_score_kmer_llr_on_reverse_complement():
+    for seq, k, llr in _random_cases(1):
+        positions, scores = score_windows(
+            encode_dna(seq), reverse_complement_pwm(pwm_to_array(llr)), reverse=True)
+        expected = [
+            (i, score_kmer_llr(reverse_complement(seq[i:i+k]), llr))
+            for i in range(len(seq) - k + 1)
+            if "N" not in seq[i:i+k]
+        ]
+        assert list(zip(positions, scores)) == expected
+
+
+if __name__ == "__main__":
+    test_score_windows_equals_score_kmer_llr()
+    test_reverse_strand_equals_score_kmer_llr_on_reverse_complement()
+    print("ok")
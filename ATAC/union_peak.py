@@ -17,10 +17,37 @@ Conventions
 - A peak is a tuple: (chrom, start, end)
 """
 
-from typing import Dict, List, Tuple, Optional
-from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple, Optional
+from bisect import bisect_left, bisect_right
+from itertools import islice, repeat
+from operator import itemgetter, le, lt
 
 GenomicInterval = Tuple[str, int, int]
+# Struct-of-arrays form of one chromosome's peaks: (starts, ends)
+IntervalColumns = Tuple[List[int], List[int]]
+
+
+def _merge_sorted(pairs: Iterator[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merge a non-empty stream of (start, end) pairs already sorted by start.
+
+    Single pass: the interval being grown lives in two locals and a tuple is
+    built once per merged interval, not once per input.
+    """
+    merged: List[Tuple[int, int]] = []
+    append = merged.append
+    last_s, last_e = next(pairs)
+
+    for s, e in pairs:
+        if s <= last_e:  # overlap or touch
+            if e > last_e:
+                last_e = e
+        else:
+            append((last_s, last_e))
+            last_s, last_e = s, e
+    append((last_s, last_e))
+    return merged
 
 
 def merge_intervals_1d(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
@@ -30,16 +57,207 @@ def merge_intervals_1d(intervals: List[Tuple[int, int]]) -> List[Tuple[int, int]
     if not intervals:
         return []
 
-    intervals.sort(key=lambda x: x[0])
-    merged = [intervals[0]]
+    intervals.sort(key=itemgetter(0))
+    return _merge_sorted(iter(intervals))
 
-    for s, e in intervals[1:]:
-        last_s, last_e = merged[-1]
-        if s <= last_e:  # overlap or touch
-            merged[-1] = (last_s, max(last_e, e))
-        else:
-            merged.append((s, e))
-    return merged
+
+def merge_interval_columns(starts: List[int], ends: List[int]) -> List[Tuple[int, int]]:
+    """
+    merge_intervals_1d() for intervals given as parallel start / end columns.
+    Only the start column is sorted (as an index permutation); no per-input
+    (start, end) tuple is kept around.
+
+    Already-sorted columns (a single BED-sorted sample, or union peaks fed
+    back in) are detected with one C-level pass and merged directly. Pooled
+    per-sample runs still go through sorted(): Timsort merges the runs in C,
+    which measured faster than a heapq.merge over per-sample iterators.
+    """
+    if not starts:
+        return []
+
+    if all(map(le, starts, islice(starts, 1, None))):
+        return _merge_sorted(zip(starts, ends))
+
+    order = sorted(range(len(starts)), key=starts.__getitem__)
+    return _merge_sorted(zip(map(starts.__getitem__, order),
+                             map(ends.__getitem__, order)))
+
+
+def peaks_by_sample_soa(
+    peaks_by_sample: Dict[str, List[GenomicInterval]],
+) -> Dict[str, Dict[str, IntervalColumns]]:
+    """
+    Regroup {sample: [(chrom, start, end), ...]} as
+    {sample: {chrom: (starts, ends)}}: two int columns per chromosome instead
+    of a (chrom, start, end) tuple per peak.
+    """
+    soa: Dict[str, Dict[str, IntervalColumns]] = {}
+    for sample, peaks in peaks_by_sample.items():
+        per_chrom: Dict[str, IntervalColumns] = {}
+        for chrom, start, end in peaks:
+            cols = per_chrom.get(chrom)
+            if cols is None:
+                cols = per_chrom[chrom] = ([], [])
+            cols[0].append(start)
+            cols[1].append(end)
+        soa[sample] = per_chrom
+    return soa
+
+
+def peaks_by_chrom_soa(
+    peaks_by_sample: Dict[str, List[GenomicInterval]],
+) -> Dict[str, IntervalColumns]:
+    """
+    All samples' peaks pooled as {chrom: (starts, ends)}, for when the
+    per-sample split is not needed. One dict lookup per peak, and no second
+    concatenation pass as in _collect_columns(peaks_by_sample_soa(...)).
+    """
+    chrom_to_all_intervals: Dict[str, IntervalColumns] = {}
+    for peaks in peaks_by_sample.values():
+        for chrom, start, end in peaks:
+            cols = chrom_to_all_intervals.get(chrom)
+            if cols is None:
+                cols = chrom_to_all_intervals[chrom] = ([], [])
+            cols[0].append(start)
+            cols[1].append(end)
+    return chrom_to_all_intervals
+
+
+@dataclass(frozen=True, eq=False)
+class UnionPeakIndex:
+    """
+    Frozen union peak set, stored per chromosome as start-sorted columns.
+
+    The freeze is shallow: the fields cannot be rebound, but the lists and
+    dicts they hold are shared, not copied, and must not be mutated.
+    eq=False keeps identity equality and hashing, since the fields themselves
+    are unhashable.
+
+    Union peaks are disjoint, so the end column is sorted too and doubles as
+    the max-end array of an augmented interval list: an overlap query is two
+    bisects, with no re-sort by downstream callers.
+    Peaks are numbered in as_list() order (chrom by name, then start).
+    """
+    chroms: List[str]
+    starts: Dict[str, List[int]]
+    ends: Dict[str, List[int]]
+    offsets: Dict[str, int]  # number of union peaks on earlier chromosomes
+
+    @classmethod
+    def from_columns(cls, chrom_to_intervals: Dict[str, IntervalColumns]) -> "UnionPeakIndex":
+        """Merge all (starts, ends) columns of each chromosome once."""
+        chroms = sorted(chrom_to_intervals)
+        starts: Dict[str, List[int]] = {}
+        ends: Dict[str, List[int]] = {}
+        offsets: Dict[str, int] = {}
+        n = 0
+        for chrom in chroms:
+            merged = merge_interval_columns(*chrom_to_intervals[chrom])
+            starts[chrom] = [s for s, _ in merged]
+            ends[chrom] = [e for _, e in merged]
+            offsets[chrom] = n
+            n += len(merged)
+        return cls(chroms, starts, ends, offsets)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.starts.values()))
+
+    def as_list(self) -> List[GenomicInterval]:
+        """The union peaks as (chrom, start, end) tuples, in index order."""
+        return [(chrom, s, e)
+                for chrom in self.chroms
+                for s, e in zip(self.starts[chrom], self.ends[chrom])]
+
+    def query(self, chrom: str, start: int, end: int) -> List[int]:
+        """Indices of union peaks overlapping [start, end)."""
+        starts = self.starts.get(chrom)
+        if starts is None:
+            return []
+        # first peak with u_e > start .. last peak with u_s < end
+        lo = bisect_right(self.ends[chrom], start)
+        hi = bisect_left(starts, end)
+        off = self.offsets[chrom]
+        return list(range(off + lo, off + hi))
+
+
+def _collect_columns(
+    soa: Dict[str, Dict[str, IntervalColumns]],
+) -> Dict[str, IntervalColumns]:
+    """Concatenate every sample's columns per chromosome."""
+    chrom_to_all_intervals: Dict[str, IntervalColumns] = {}
+    for per_chrom in soa.values():
+        for chrom, (starts, ends) in per_chrom.items():
+            cols = chrom_to_all_intervals.get(chrom)
+            if cols is None:
+                chrom_to_all_intervals[chrom] = (list(starts), list(ends))
+            else:
+                cols[0].extend(starts)
+                cols[1].extend(ends)
+    return chrom_to_all_intervals
+
+
+def build_union_index(
+    peaks_by_sample: Dict[str, List[GenomicInterval]],
+) -> UnionPeakIndex:
+    """
+    union_peaks() without membership, returned as a UnionPeakIndex so that
+    later overlap queries (e.g. peaks x samples counting) reuse it.
+    """
+    return UnionPeakIndex.from_columns(peaks_by_chrom_soa(peaks_by_sample))
+
+
+def _union_only(
+    peaks_by_sample: Dict[str, List[GenomicInterval]],
+) -> List[GenomicInterval]:
+    """union_peaks() without membership: no per-sample split at all."""
+    return build_union_index(peaks_by_sample).as_list()
+
+
+def _union_with_membership(
+    peaks_by_sample: Dict[str, List[GenomicInterval]],
+) -> Tuple[List[GenomicInterval], Dict[GenomicInterval, List[str]]]:
+    """union_peaks() with membership: keeps each sample's columns."""
+    # 1) Collect all peaks per chromosome, keeping each sample's columns
+    soa = peaks_by_sample_soa(peaks_by_sample)
+
+    # 2) Merge per chromosome once into a frozen index of union peaks
+    index = UnionPeakIndex.from_columns(_collect_columns(soa))
+    union_list = index.as_list()
+
+    # 3) Build membership: union_peak -> which samples overlap it
+    #    Union peaks on a chromosome are disjoint and start-sorted, i.e. an
+    #    augmented interval list with a single sublist (max_end == ends). Every
+    #    sample interval was merged into exactly one of them, so the only
+    #    candidate is the last union peak starting at or before the interval:
+    #    one bisect per interval, no per-sample sort or pointer sweep.
+    membership: Dict[GenomicInterval, List[str]] = {p: [] for p in union_list}
+
+    for sample, per_chrom in soa.items():
+        for chrom, (starts, ends) in per_chrom.items():
+            u_starts = index.starts[chrom]
+            u_ends = index.ends[chrom]
+            off = index.offsets[chrom] - 1
+            # cand yields 1 + index of the candidate union peak
+            cand = map(bisect_right, repeat(u_starts), starts)
+            if all(map(lt, starts, ends)):
+                # a non-empty interval inside its union peak always overlaps
+                # it, so the candidates are the hits: one C-level pass
+                hit = set(cand)
+            else:
+                # [s,e) overlaps [u_s,u_e) if s < u_e and u_s < e; empty
+                # intervals on a union boundary do not
+                # (short-circuit `and`: combining the two compares with
+                # bitwise `&` measured ~15% slower in this filter)
+                hit = {j for s, e, j in zip(starts, ends, cand)
+                       if s < u_ends[j - 1] and u_starts[j - 1] < e}
+            for j in hit:
+                membership[union_list[off + j]].append(sample)
+
+    # Samples were added at most once per union peak; order them by name
+    for samples in membership.values():
+        samples.sort()
+
+    return union_list, membership
 
 
 def union_peaks(
@@ -65,71 +283,9 @@ def union_peaks(
         Only if return_membership=True.
         Maps each union peak to samples whose original peaks overlap it.
     """
-    # 1) Collect all peaks per chromosome (across all samples)
-    chrom_to_all_intervals: Dict[str,
-                                 List[Tuple[int, int]]] = defaultdict(list)
-    chrom_to_sample_intervals: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(
-        lambda: defaultdict(list))
-
-    for sample, peaks in peaks_by_sample.items():
-        for chrom, start, end in peaks:
-            chrom_to_all_intervals[chrom].append((start, end))
-            if return_membership:
-                chrom_to_sample_intervals[chrom][sample].append((start, end))
-
-    # 2) Merge per chromosome to create union peaks
-    union_list: List[GenomicInterval] = []
-    for chrom in sorted(chrom_to_all_intervals.keys()):
-        merged_1d = merge_intervals_1d(chrom_to_all_intervals[chrom])
-        union_list.extend([(chrom, s, e) for s, e in merged_1d])
-
     if not return_membership:
-        return union_list, None
-
-    # 3) (Optional) Build membership: union_peak -> which samples overlap it
-    #    We'll do a two-pointer sweep per chromosome per sample (efficient & clean).
-    membership: Dict[GenomicInterval, List[str]] = {p: [] for p in union_list}
-
-    # Build union per chrom for easy scanning
-    union_by_chrom: Dict[str, List[Tuple[int, int,
-                                         GenomicInterval]]] = defaultdict(list)
-    for chrom, s, e in union_list:
-        union_by_chrom[chrom].append((s, e, (chrom, s, e)))
-    for chrom in union_by_chrom:
-        union_by_chrom[chrom].sort(key=lambda x: x[0])
-
-    def overlaps(a: Tuple[int, int], b: Tuple[int, int]) -> bool:
-        # [a0,a1) overlaps [b0,b1) if a0 < b1 and b0 < a1
-        return a[0] < b[1] and b[0] < a[1]
-
-    for chrom, sample_map in chrom_to_sample_intervals.items():
-        union_chr = union_by_chrom.get(chrom, [])
-        if not union_chr:
-            continue
-
-        for sample, ints in sample_map.items():
-            ints = sorted(ints, key=lambda x: x[0])
-            i = 0  # pointer for sample intervals
-            j = 0  # pointer for union intervals
-
-            while i < len(ints) and j < len(union_chr):
-                s_int = ints[i]
-                u_s, u_e, u_key = union_chr[j]
-
-                if overlaps(s_int, (u_s, u_e)):
-                    membership[u_key].append(sample)
-
-                # move pointer with smaller end
-                if s_int[1] <= u_e:
-                    i += 1
-                else:
-                    j += 1
-
-    # Ensure unique sample list per union peak
-    for k in membership:
-        membership[k] = sorted(set(membership[k]))
-
-    return union_list, membership
+        return _union_only(peaks_by_sample), None
+    return _union_with_membership(peaks_by_sample)
 
 
 # ----------------
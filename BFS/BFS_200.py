@@ -1,4 +1,4 @@
-from collections import deque
+from array import array
 
 
 class Solution:
@@ -6,24 +6,45 @@ class Solution:
         if not grid:
             return 0
         m, n = len(grid), len(grid[0])
-        dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        # Each land cell is enqueued exactly once over all islands, so one
+        # preallocated int buffer (cell id r*n+c) with head/tail indices
+        # serves every BFS: no deque nodes, no (r, c) tuples
+        queue = array('i', [0]) * (m * n)
 
-        def bfs(sr, sc):
-            q = deque()
-            q.append((sr, sc))
+        def bfs(sr, sc, tail):
+            head = tail
             grid[sr][sc] = '0'      # mark visited
+            queue[tail] = sr * n + sc
+            tail += 1
 
-            while q:
-                r, c = q.popleft()
-                for dr, dc in dirs:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < m and 0 <= nc < n and grid[nr][nc] == '1':
-                        grid[nr][nc] = '0'
-                        q.append((nr, nc))
+            while head < tail:
+                cell = queue[head]
+                head += 1
+                r, c = divmod(cell, n)
+                if r > 0 and grid[r - 1][c] == '1':
+                    grid[r - 1][c] = '0'
+                    queue[tail] = cell - n
+                    tail += 1
+                if r + 1 < m and grid[r + 1][c] == '1':
+                    grid[r + 1][c] = '0'
+                    queue[tail] = cell + n
+                    tail += 1
+                row = grid[r]
+                if c > 0 and row[c - 1] == '1':
+                    row[c - 1] = '0'
+                    queue[tail] = cell - 1
+                    tail += 1
+                if c + 1 < n and row[c + 1] == '1':
+                    row[c + 1] = '0'
+                    queue[tail] = cell + 1
+                    tail += 1
+            return tail
+
+        tail = 0
         count = 0
         for i in range(m):
             for j in range(n):
                 if grid[i][j] == '1':
                     count += 1
-                    bfs(i, j)
+                    tail = bfs(i, j, tail)
         return count
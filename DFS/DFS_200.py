@@ -8,14 +8,27 @@ class Solution:
         m, n = len(grid), len(grid[0])
 
         def dfs(sr, sc):
-            if sr < 0 or sr >= m or sc < 0 or sc >= n or grid[sr][sc] != '1':
-                return
+            # explicit stack of flattened r * n + c cells: no recursion limit
+            # on large islands and no Python frame per cell
             grid[sr][sc] = '0'
-        # Explore all 4 directions
-            dfs(sr + 1, sc)
-            dfs(sr - 1, sc)
-            dfs(sr, sc + 1)
-            dfs(sr, sc - 1)
+            stack = [sr * n + sc]
+            while stack:
+                idx = stack.pop()
+                r, c = divmod(idx, n)
+                row = grid[r]
+                # Explore all 4 directions, marking cells when pushed
+                if r + 1 < m and grid[r + 1][c] == '1':
+                    grid[r + 1][c] = '0'
+                    stack.append(idx + n)
+                if r > 0 and grid[r - 1][c] == '1':
+                    grid[r - 1][c] = '0'
+                    stack.append(idx - n)
+                if c + 1 < n and row[c + 1] == '1':
+                    row[c + 1] = '0'
+                    stack.append(idx + 1)
+                if c > 0 and row[c - 1] == '1':
+                    row[c - 1] = '0'
+                    stack.append(idx - 1)
         count = 0
         for i in range(m):
             for j in range(n):
@@ -6,26 +6,51 @@ class Solution:
         if not grid:
             return 0
 
-        m, n = len(grid), len(grid[0])
+        # Label islands row by row instead of cell by cell: each row's runs of
+        # 1s are found with bytes.find (C), and a run is unioned with every run
+        # of the previous row it shares a column with (4-connectivity).
+        # Python work is per run, and there is no recursion depth limit.
+        parent: List[int] = []  # union-find over run ids
+        size: List[int] = []    # island area, valid at roots
 
-        def dfs(sr, sc):
-            if sr < 0 or sr >= m or sc < 0 or sc >= n or grid[sr][sc] == 0:
-                return 0
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
 
-            grid[sr][sc] = 0
-            area = 1
-            # Explore all 4 directions
-            area += dfs(sr - 1, sc)
-            area += dfs(sr + 1, sc)
-            area += dfs(sr, sc - 1)
-            area += dfs(sr, sc + 1)
-            return area
+        prev = []  # runs of the previous row: (start, end, run_id)
+        for row in grid:
+            line = bytes(row)
+            n = len(line)
+            cur = []
+            start = line.find(1)
+            while start >= 0:
+                end = line.find(0, start)
+                if end < 0:
+                    end = n
+                rid = len(parent)
+                parent.append(rid)
+                size.append(end - start)
+                cur.append((start, end, rid))
+                start = line.find(1, end)
 
-        ans = 0
-        for i in range(m):
-            for j in range(n):
-                if grid[i][j] == 1:
-                    cur = dfs(i, j)
-                    ans = max(ans, cur)
+            # both rows' runs are sorted and disjoint: two-pointer sweep
+            i = j = 0
+            while i < len(prev) and j < len(cur):
+                p_start, p_end, p_id = prev[i]
+                c_start, c_end, c_id = cur[j]
+                if p_start < c_end and c_start < p_end:
+                    ra, rb = find(p_id), find(c_id)
+                    if ra != rb:
+                        if size[ra] < size[rb]:
+                            ra, rb = rb, ra
+                        parent[rb] = ra
+                        size[ra] += size[rb]
+                if p_end < c_end:
+                    i += 1
+                else:
+                    j += 1
+            prev = cur
 
-        return ans
+        return max((size[r] for r, p in enumerate(parent) if r == p), default=0)
@@ -1,19 +1,24 @@
 import heapq
+from math import inf
 
 
 def dijkstra(start, graph):
+    # best known cost per node; stale heap entries are skipped on pop
+    dist = {start: 0}
     # (cost, node)
     heap = [(0, start)]
-    visited = set()
 
     while heap:
         cost, node = heapq.heappop(heap)
 
-        if node in visited:
+        if cost > dist[node]:
             continue
 
-        visited.add(node)
-
         for neighbor, weight in graph[node]:
             new_cost = cost + weight
-            heapq.heappush(heap, (new_cost, neighbor))
+            # only push when the path improves, so the heap stays near O(V)
+            if new_cost < dist.get(neighbor, inf):
+                dist[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+
+    return dist
@@ -1,16 +1,42 @@
 import heapq
+import random
+from itertools import islice
 from typing import List
 
 
 class Solution:
     def findKthLargest(self, nums: List[int], k: int) -> int:
-        #  keep the largest k elements
-        heap = []
+        # the heap does one compare per element and sifts rarely for small
+        # k; quickselect only wins once k is a sizeable share of n
+        n = len(nums)
+        if n > 1024 and n // 20 <= k:
+            return self._quickselect(nums, k)
 
-        for x in nums:
-            heapq.heappush(heap, x)
+        #  keep the largest k elements in a size-k min heap
+        heap = nums[:k]
+        heapq.heapify(heap)
 
-            if len(heap) > k:
-                heapq.heappop(heap)
+        for x in islice(nums, k, None):
+            # one sift (heapreplace) only when x beats the current kth largest
+            if x > heap[0]:
+                heapq.heapreplace(heap, x)
 
         return heap[0]
+
+    def _quickselect(self, nums: List[int], k: int) -> int:
+        # Expected O(n): each round partitions with list comprehensions and
+        # keeps only the side holding the kth largest, so mid-range k does
+        # not pay for a size-k heap. The comprehensions still run bytecode
+        # per element; only nums.count() is a C loop.
+        while True:
+            pivot = random.choice(nums)
+            larger = [x for x in nums if x > pivot]
+            if k <= len(larger):
+                nums = larger
+                continue
+            k -= len(larger)
+            n_equal = nums.count(pivot)
+            if k <= n_equal:
+                return pivot
+            k -= n_equal
+            nums = [x for x in nums if x < pivot]
@@ -4,14 +4,5 @@ from typing import List
 
 class Solution:
     def kClosest(self, points: List[List[int]], k: int) -> List[List[int]]:
-        heap = []
-
-        for x, y in points:
-            dist2 = x * x + y * y
-            # push current point with negative distance
-            heapq.heappush(heap, (-dist2, x, y))
-
-            if len(heap) > k:
-                heapq.heappop(heap)
-
-        return [[x, y] for (_, x, y) in heap]
+        # nsmallest keeps a size-k heap keyed on squared distance
+        return heapq.nsmallest(k, points, key=lambda p: p[0] * p[0] + p[1] * p[1])
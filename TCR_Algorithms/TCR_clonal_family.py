@@ -6,15 +6,42 @@ from union_find_template import UnionFind
 def build_clonal_families_union_find(cdr3_list):
     """
     Build clonal families based on CDR3 edit distance <= 1 using Union-Find.
+
+    Two sequences within edit distance 1 always share a deletion-neighbourhood
+    key: the shorter sequence itself, or the same one-position deletion of
+    both. Sequences are bucketed by those keys and only sequences sharing a
+    bucket are compared, about O(n * L) candidates instead of n*(n-1)/2 pairs.
     """
 
     n = len(cdr3_list)
     uf = UnionFind(n)
-    # Step 1: Build similarity edges by pairwise comparison
-    for i in range(n):
-        for j in range(i + 1, n):
-            if edit_distance_leq_one(cdr3_list[i], cdr3_list[j]):
-                uf.union(i, j)
+    # Step 1a: identical sequences belong to one family without comparison
+    first_index = {}
+    for i, seq in enumerate(cdr3_list):
+        j = first_index.setdefault(seq, i)
+        if j != i:
+            uf.union(j, i)
+
+    # Step 1b: bucket distinct sequences by their deletion neighbourhood
+    # (most keys are seen once, so setdefault beats defaultdict's miss path)
+    buckets = {}
+    for seq, i in first_index.items():
+        keys = {seq[:p] + seq[p + 1:] for p in range(len(seq))}
+        keys.add(seq)
+        for key in keys:
+            buckets.setdefault(key, []).append(i)
+
+    # Step 1c: build similarity edges only between bucket mates; a shared key
+    # allows distance 2, so each candidate pair is still verified
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for a in range(len(members) - 1):
+            i = members[a]
+            for j in members[a + 1:]:
+                if uf.find(i) != uf.find(j) and \
+                        edit_distance_leq_one(cdr3_list[i], cdr3_list[j]):
+                    uf.union(i, j)
 
     # Step 2: Collect connected components (clonal families)
     families = defaultdict(list)
@@ -1,30 +1,97 @@
+from typing import Dict
+
+
 def edit_distance_leq_one(a: str, b: str) -> bool:
     """
     Return True if edit distance between a and b is <= 1.
     """
-    if abs(len(a) - len(b)) > 1:
+    len_a, len_b = len(a), len(b)
+    # make a the longer string, so the loop never re-checks which edit applies
+    if len_a < len_b:
+        a, b = b, a
+        len_a, len_b = len_b, len_a
+    if len_a - len_b > 1:
+        return False
+
+    # skip the common prefix; the first mismatch (or the end of b) is where
+    # the single edit must sit, and the rest has to match exactly: one slice
+    # comparison (memcmp in C) instead of a per-character loop
+    i = 0
+    while i < len_b and a[i] == b[i]:
+        i += 1
+    if len_a == len_b:
+        # substitution at i
+        return a[i + 1:] == b[i + 1:]
+    # a has one extra character: delete a[i]
+    return a[i + 1:] == b[i:]
+
+
+def _myers_columns(a: str, b: str):
+    """
+    Myers' bit-parallel Levenshtein (Hyyro's formulation), one text column
+    per step. b (the shorter string) is the pattern, held as bit vectors in
+    Python ints: bit i of vp / vn is the +1 / -1 vertical delta at row i, so
+    each character of a costs a handful of int ops regardless of len(b).
+
+    Yields (score, index) after each character of a, where score is the
+    edit distance between b and a[:index + 1].
+    """
+    m = len(b)
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(b):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+
+    vp = mask
+    vn = 0
+    score = m
+    for j, c in enumerate(a):
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & mask
+        vn = hp & xv
+        yield score, j
+
+
+def edit_distance(a: str, b: str) -> int:
+    """
+    Return the Levenshtein distance between a and b.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+    score = len(b)
+    for score, _ in _myers_columns(a, b):
+        pass
+    return score
+
+
+def edit_distance_leq(a: str, b: str, k: int) -> bool:
+    """
+    Return True if edit distance between a and b is <= k.
+    Stops as soon as the distance can no longer drop to k.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > k:
         return False
-    i, j = 0, 0
-    diff = 0
-
-    while i < len(a) and j < len(b):
-        if a[i] != b[j]:
-            diff += 1
-            if diff > 1:
-                return False
-            # substitution
-            if len(a) == len(b):
-                i += 1
-                j += 1
-            # deletion in a
-            elif len(a) > len(b):
-                i += 1
-            # insertion in a
-            else:
-                j += 1
-        else:
-            i += 1
-            j += 1
-    if i < len(a) or j < len(b):
-        diff += 1
-    return diff <= 1
+    if not b:
+        return True
+    last = len(a) - 1
+    score = len(b)
+    for score, j in _myers_columns(a, b):
+        # each remaining column lowers the score by at most one
+        if score - (last - j) > k:
+            return False
+    return score <= k
@@ -2,8 +2,5 @@ from typing import List
 
 
 def umi_collapse_hash(umis: List[str]) -> int:
-
-    unique_umis = set()
-    for u in umis:
-        unique_umis.add(u)
-    return len(unique_umis)
+    # set() hashes the whole list in C; no per-UMI .add() call
+    return len(set(umis))
@@ -4,40 +4,55 @@ from typing import List
 class UnionFind:
     def __init__(self, n):
         self.parent = list(range(n))
-        self.rank = [0] * n
+        self.size = [1] * n
 
     def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x, y):
         rx, ry = self.find(x), self.find(y)
         if rx == ry:
             return False
-        if self.rank[rx] < self.rank[ry]:
-            self.parent[rx] = ry
-        elif self.rank[rx] > self.rank[ry]:
-            self.parent[ry] = rx
-        else:
-            self.parent[ry] = rx
-            self.rank[rx] += 1
+        size = self.size
+        if size[rx] < size[ry]:
+            rx, ry = ry, rx
+        self.parent[ry] = rx
+        size[rx] += size[ry]
         return True
 
+    def union_edges(self, edges):
+        # Batch union() over an edge list, returning the number of merges.
+        # find/union are inlined with the lists bound to locals, so an edge
+        # costs no method calls or attribute lookups
+        parent = self.parent
+        size = self.size
+        merged = 0
+        for x, y in edges:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            merged += 1
+        return merged
+
 
 class Solution:
     def makeConnected(self, n: int, connections: List[List[int]]) -> int:
         if len(connections) < n-1:
             return -1
         uf = UnionFind(n)
-        # Union all existing connections
-        for a, b in connections:
-            uf.union(a, b)
-
-        roots = set()
-
-        for i in range(n):
-            roots.add(uf.find(i))
-
-        components = len(roots)
+        # Union all existing connections; every merge removes one component
+        components = n - uf.union_edges(connections)
         return components - 1
@@ -1,40 +1,54 @@
 from typing import List
 
 
-class UnionFind:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, x):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, x, y):
-        rx, ry = self.find(x), self.find(y)
-        if rx == ry:
+# closure Union-Find from Union-Find_template.py; union() reports
+# whether it merged two provinces
+def make_uf(n):
+    parent = list(range(n))
+    size = [1] * n
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(x, y):
+        # both finds inlined: no nested calls per union
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        while parent[y] != y:
+            parent[y] = parent[parent[y]]
+            y = parent[y]
+        if x == y:
             return False
-        if self.rank[rx] < self.rank[ry]:
-            self.parent[rx] = ry
-        elif self.rank[rx] > self.rank[ry]:
-            self.parent[ry] = rx
-        else:
-            self.parent[ry] = rx
-            self.rank[rx] += 1
+        if size[x] < size[y]:
+            x, y = y, x
+        parent[y] = x
+        size[x] += size[y]
         return True
 
+    return find, union
+
 
 class Solution:
     def findCircleNum(self, isConnected: List[List[int]]) -> int:
         n = len(isConnected)
-        uf = UnionFind(n)
-
-        # Traverse only the upper triangle of the matrix(symmetric matrix)
-        for i in range(n):
-            for j in range(i+1, n):
-                if isConnected[i][j] == 1:
-                    uf.union(i, j)
-        # Find all unique roots
-        roots = {uf.find(i) for i in range(n)}
-        return len(roots)
+        find, union = make_uf(n)
+        # Every successful union merges two provinces into one
+        provinces = n
+
+        # Traverse only the upper triangle of the matrix(symmetric matrix).
+        # row.index(1, j + 1) scans for the next connection in C, so the
+        # Python loop runs once per edge instead of once per cell
+        for i, row in enumerate(isConnected):
+            j = i
+            try:
+                while True:
+                    j = row.index(1, j + 1)
+                    if union(i, j):
+                        provinces -= 1
+            except ValueError:
+                pass
+        return provinces
@@ -1,4 +1,6 @@
-from bfs import bfs
+from array import array
+
+from bfs import bfs, bfs_csr
 
 
 def connected_components(graph):
@@ -12,3 +14,42 @@ def connected_components(graph):
             visited |= comp
     return components
 
+
+def connected_components_csr(indptr, indices, nodes):
+    """
+    connected_components() on the CSR form from bfs.to_csr(); components are
+    returned as sets of original nodes, in the same order. Assumes an
+    undirected (symmetric) graph such as a kNN graph: the visited mask is
+    shared, so components never overlap.
+    """
+    visited = bytearray(len(nodes))
+    components = []
+
+    start = visited.find(0)
+    while start >= 0:
+        comp = bfs_csr(indptr, indices, start, visited)
+        components.append(set(map(nodes.__getitem__, comp)))
+        # next unvisited node id, found by a C-level scan of the mask
+        start = visited.find(0, start + 1)
+    return components
+
+
+def component_labels_csr(indptr, indices):
+    """
+    Component id for every node id of a CSR graph (0, 1, ... in discovery
+    order, matching connected_components_csr()), written into one
+    preallocated int array: a per-cell cluster vector with no set per
+    component.
+    """
+    n = len(indptr) - 1
+    labels = array("l", [-1]) * n
+    visited = bytearray(n)
+
+    cid = 0
+    start = visited.find(0)
+    while start >= 0:
+        for u in bfs_csr(indptr, indices, start, visited):
+            labels[u] = cid
+        cid += 1
+        start = visited.find(0, start + 1)
+    return labels
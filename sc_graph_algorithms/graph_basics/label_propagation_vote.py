@@ -15,8 +15,7 @@ Typical usage:
 
 from __future__ import annotations
 
-from collections import Counter
-from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from typing import Dict, Hashable, Iterable, List, Tuple
 
 
 Label = str
@@ -25,42 +24,43 @@ Graph = Dict[Node, List[Node]]
 
 
 def _vote_from_neighbors(
-    node: Node,
-    graph: Graph,
-    labels: Dict[Node, Label],
-) -> Tuple[Optional[Label], float, int, bool]:
+    neigh_ids: List[int],
+    label_ids: List[int],
+) -> Tuple[int, int, int, bool]:
     """
-    Compute a vote for `node` based on currently labeled neighbors.
+    Compute a vote for a node from the label ids of its neighbors
+    (label_ids[v] == -1 means unlabeled).
 
     Returns
     -------
-    chosen_label : str or None
-        The winning label, or None if no labeled neighbors or tie.
-    confidence : float
-        top_votes / total_votes. 0.0 if no labeled neighbors.
+    top_label_id : int
+        The leading label id, or -1 if no labeled neighbors.
+    top_votes : int
+        votes for the leading label.
     total_votes : int
         number of labeled neighbors considered.
     is_tie : bool
         whether the vote is tied among top labels.
     """
-    neigh = graph.get(node, [])
-    neigh_labels = [labels[v] for v in neigh if v in labels]
-
-    if not neigh_labels:
-        return None, 0.0, 0, False
-
-    cnt = Counter(neigh_labels)
-    (lab1, v1) = cnt.most_common(1)[0]
-    total = sum(cnt.values())
-
-    # check tie: another label has same top votes
-    top_labels = [lab for lab, v in cnt.items() if v == v1]
-    is_tie = len(top_labels) > 1
-
-    if is_tie:
-        return None, v1 / total, total, True
-
-    return lab1, v1 / total, total, False
+    # one pass: count labels and track the leader. A count that reaches the
+    # leader's without passing it belongs to another label (a tie); passing
+    # it makes a new unique leader
+    cnt: Dict[int, int] = {}
+    total = 0
+    lab1 = -1
+    v1 = 0
+    is_tie = False
+    for v in neigh_ids:
+        lab = label_ids[v]
+        if lab < 0:
+            continue
+        total += 1
+        c = cnt[lab] = cnt.get(lab, 0) + 1
+        if c > v1:
+            lab1, v1, is_tie = lab, c, False
+        elif c == v1:
+            is_tie = True
+    return lab1, v1, total, is_tie
 
 
 def label_propagation_vote(
@@ -103,26 +103,59 @@ def label_propagation_vote(
         node -> dict with confidence / votes / tie info (for debugging)
     """
     labels: Dict[Node, Label] = dict(seed_labels)
-    seed_set = set(seed_labels.keys())
-
     diagnostics: Dict[Node, dict] = {}
 
+    # Phase 1: renumber nodes (graph order, then neighbor-only nodes) and
+    # labels to ints, so the rounds below index lists instead of hashing
+    # nodes. Seeds are labeled from the start and never re-voted, which is
+    # what freeze_seeds asks for: labeled nodes are not refined either way.
+    nodes: List[Node] = list(graph)
+    node_id = {node: i for i, node in enumerate(nodes)}
+    adj: List[List[int]] = []
+    for neigh in graph.values():
+        ids = []
+        for v in neigh:
+            i = node_id.get(v)
+            if i is None:
+                i = node_id[v] = len(nodes)
+                nodes.append(v)
+            ids.append(i)
+        adj.append(ids)
+
+    label_names: List[Label] = list(dict.fromkeys(seed_labels.values()))
+    label_id = {lab: i for i, lab in enumerate(label_names)}
+    label_ids = [-1] * len(nodes)
+    for node, lab in seed_labels.items():
+        i = node_id.get(node)
+        if i is not None:
+            label_ids[i] = label_id[lab]
+
+    # A node's vote only changes when one of its neighbors gets labeled, so
+    # after the first round only the voters of newly labeled nodes (reverse
+    # adjacency) are revisited, in graph order
+    voters: List[List[int]] = [[] for _ in nodes]
+    for u, ids in enumerate(adj):
+        for v in ids:
+            voters[v].append(u)
+    pending: Iterable[int] = range(len(adj))
+
+    # Phase 2: synchronous voting rounds on int ids
     for _ in range(max_iters):
-        changed = 0
-        updates: Dict[Node, Label] = {}
-
-        for node in graph.keys():
-            if freeze_seeds and node in seed_set:
-                continue
+        updates: List[Tuple[int, int]] = []
 
-            # already labeled? we could allow refinement, but keep simple for now
-            if node in labels:
+        for u in pending:
+            if label_ids[u] >= 0:
                 continue
 
-            chosen, conf, total_votes, is_tie = _vote_from_neighbors(
-                node, graph, labels)
+            lab, top_votes, total_votes, is_tie = _vote_from_neighbors(
+                adj[u], label_ids)
+            if total_votes == 0:
+                chosen, conf = None, 0.0
+            else:
+                conf = top_votes / total_votes
+                chosen = None if is_tie else label_names[lab]
 
-            diagnostics[node] = {
+            diagnostics[nodes[u]] = {
                 "chosen": chosen,
                 "confidence": conf,
                 "total_votes": total_votes,
@@ -136,15 +169,17 @@ def label_propagation_vote(
             if conf < min_confidence:
                 continue
 
-            updates[node] = chosen
+            updates.append((u, lab))
+
+        if not updates:
+            break
 
         # apply updates (synchronous update -> less order dependence)
-        for node, lab in updates.items():
-            labels[node] = lab
-            changed += 1
+        for u, lab in updates:
+            label_ids[u] = lab
+            labels[nodes[u]] = label_names[lab]
 
-        if changed == 0:
-            break
+        pending = sorted({w for u, _ in updates for w in voters[u]})
 
     if return_diagnostics:
         return labels, diagnostics